@@ -0,0 +1,629 @@
+import asyncio
+import gzip
+from contextlib import asynccontextmanager
+from functools import partial
+import httpx
+from langsmith import Client
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional
+
+from migration import (
+    EXAMPLES_BULK_CHUNK_SIZE,
+    GZIP_COMPRESS_LEVEL,
+    GZIP_HEADERS,
+    NON_IDEMPOTENT_METHODS,
+    PAGE_SIZE,
+    PRELOAD_MIN_REFERENCES,
+    PROMPT_MIGRATION_WORKERS,
+    RETRY_BACKOFF_FACTOR,
+    RETRY_STATUS_CODES,
+    RETRY_TOTAL,
+    RUNS_BATCH_SIZE,
+    _AdaptiveLimit,
+    _RunsPageParser,
+    _create_annotation_queue_payload,
+    _create_dataset_payload,
+    _create_rule_payload,
+    _create_tracer_payload,
+    _group_by_name,
+    _json_dumps,
+    _json_loads,
+    _new_example_payload,
+    _new_run_payload,
+    ijson,
+)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+MAX_CONCURRENT_REQUESTS = 8
+MAX_PENDING_UPLOADS = 4
+PAGE_FETCH_WINDOW = 8
+
+
+async def _achunked(iterable: AsyncIterator[Any], size: int) -> AsyncIterator[List[Any]]:
+    """
+    Yield lists of up to `size` consecutive items from an async iterable.
+    """
+    chunk = []
+    async for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _cancel_all(tasks: List[asyncio.Future]):
+    """
+    Cancel `tasks` and wait for them to finish, discarding their results.
+    """
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _AsyncByteReader:
+    """
+    Expose an async iterator of byte chunks through the async read() interface ijson expects.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class AsyncAdaptiveConcurrencyLimiter(_AdaptiveLimit):
+    """
+    asyncio counterpart of AdaptiveConcurrencyLimiter.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created on first use so that it binds to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self):
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, status_code: Optional[int] = None):
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            if status_code is not None:
+                self._adjust(status_code)
+            condition.notify_all()
+
+    async def record(self, status_code: int):
+        condition = self._get_condition()
+        async with condition:
+            self._adjust(status_code)
+            condition.notify_all()
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """
+    Seconds to wait before retrying, honoring a numeric Retry-After header.
+    """
+    try:
+        return float(response.headers["Retry-After"])
+    except (AttributeError, KeyError, ValueError):
+        return RETRY_BACKOFF_FACTOR * (2 ** attempt)
+
+
+def _is_retryable(method: str, status_code: Optional[int]) -> bool:
+    """
+    Whether a response with `status_code` to a `method` request may be safely retried.
+    Non-idempotent requests are only retried when rate-limited.
+    """
+    if method.upper() in NON_IDEMPOTENT_METHODS:
+        return status_code == 429
+    return status_code in RETRY_STATUS_CODES
+
+class AsyncLangsmithMigrator:
+
+    def __init__(self, old_api_key: str, new_api_key: str, max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS):
+        self.old_headers = {"X-API-Key": old_api_key}
+        self.new_headers = {"X-API-Key": new_api_key}
+        self.base_url = "https://api.smith.langchain.com/api/v1"
+        self.old_client = Client(api_key=old_api_key)
+        self.new_client = Client(api_key=new_api_key)
+        self.old_session = self._create_session(self.old_headers)
+        self.new_session = self._create_session(self.new_headers)
+        self._dataset_tasks: Dict[str, asyncio.Task] = {}
+        self._queue_tasks: Dict[str, asyncio.Task] = {}
+        # Snapshots of the new instance's datasets/queues by name, filled by preload_existing_resources
+        self._existing_datasets_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._existing_queues_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._old_limiter = AsyncAdaptiveConcurrencyLimiter(max_limit=max_concurrent_requests)
+        self._new_limiter = AsyncAdaptiveConcurrencyLimiter(max_limit=max_concurrent_requests)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Release the pooled connections held by both clients.
+        """
+        await self.old_session.aclose()
+        await self.new_session.aclose()
+
+    @staticmethod
+    def _create_session(headers: Dict[str, str]) -> httpx.AsyncClient:
+        """
+        Create a client that multiplexes requests over pooled (HTTP/2 when available) connections.
+        """
+        # httpx already sets Accept-Encoding to include br/zstd when their decoders are installed
+        return httpx.AsyncClient(
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                **headers,
+            },
+            # The transport retries failed connection attempts, which never reach the server
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64),
+                retries=RETRY_TOTAL,
+            ),
+            timeout=httpx.Timeout(60.0),
+        )
+
+    async def _request(self, session: httpx.AsyncClient, method: str, url: str, compress: bool = False, **kwargs) -> Any:
+        """
+        Send a request and return the parsed JSON body.
+        A `json` payload is serialized, and gzip-compressed when `compress=True`.
+        Requests are bounded by the instance's adaptive limiter. Rate-limited or transiently
+        failing requests, and idempotent requests that hit a transport error, are retried with
+        backoff. Raises httpx.HTTPStatusError for an error response that is not retried or
+        still fails after the last retry.
+        """
+        limiter = self._new_limiter if session is self.new_session else self._old_limiter
+        if "json" in kwargs:
+            body = _json_dumps(kwargs.pop("json"))
+            if compress:
+                kwargs["content"] = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+                kwargs["headers"] = GZIP_HEADERS
+            else:
+                kwargs["content"] = body
+        for attempt in range(RETRY_TOTAL + 1):
+            await limiter.acquire()
+            response = None
+            try:
+                response = await session.request(method, url, **kwargs)
+            except httpx.TransportError:
+                # A request that failed mid-flight may have been applied, so only idempotent ones are resent
+                if method.upper() in NON_IDEMPOTENT_METHODS or attempt == RETRY_TOTAL:
+                    raise
+            finally:
+                await limiter.release(response.status_code if response is not None else None)
+            if response is not None and (not _is_retryable(method, response.status_code) or attempt == RETRY_TOTAL):
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+        response.raise_for_status()
+        return _json_loads(response.content) if response.content else None
+
+    async def _iter_all_pages(self, session: httpx.AsyncClient, url: str, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every item from an offset-paginated endpoint, page by page.
+        Requests a growing window of pages concurrently and stops at the first short page.
+        """
+        offset = 0
+        window = 1
+        while True:
+            pages = await asyncio.gather(*[
+                self._request(session, "GET", url, params={**params, "offset": offset + i * PAGE_SIZE, "limit": PAGE_SIZE})
+                for i in range(window)
+            ])
+            for page in pages:
+                for item in page:
+                    yield item
+                if len(page) < PAGE_SIZE:
+                    return
+            offset += window * PAGE_SIZE
+            window = min(window * 2, PAGE_FETCH_WINDOW)
+
+    async def _get_all_pages(self, session: httpx.AsyncClient, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch every item from an offset-paginated endpoint.
+        """
+        return [item async for item in self._iter_all_pages(session, url, params)]
+
+    async def _iter_runs(self, get_runs_payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every run matched by a /runs/query payload, following the cursor across pages.
+        With ijson installed, runs are parsed one at a time from each streamed response
+        instead of loading whole pages into memory.
+        """
+        url = f"{self.base_url}/runs/query"
+        while True:
+            if ijson is None:
+                get_runs_body = await self._request(self.old_session, "POST", url, json=get_runs_payload)
+                for run in get_runs_body["runs"]:
+                    yield run
+                next_cursor = get_runs_body["cursors"]["next"]
+            else:
+                parser = _RunsPageParser()
+                async with self._stream_runs_query(url, get_runs_payload) as response:
+                    events = ijson.parse_async(_AsyncByteReader(response.aiter_bytes()))
+                    async for prefix, event, value in events:
+                        run = parser.feed(prefix, event, value)
+                        if run is not None:
+                            yield run
+                parser.check_complete()
+                next_cursor = parser.next_cursor
+            if next_cursor is None:
+                return
+            get_runs_payload = {**get_runs_payload, "cursor": next_cursor}
+
+    @asynccontextmanager
+    async def _stream_runs_query(self, url: str, get_runs_payload: Dict[str, Any]) -> AsyncIterator[httpx.Response]:
+        """
+        Open a streamed /runs/query response, retrying rate-limited or transiently failing requests.
+        """
+        content = _json_dumps(get_runs_payload)
+        for attempt in range(RETRY_TOTAL + 1):
+            # Not gated by the limiter: the stream stays open while its runs are
+            # pushed, and those pushes need limiter slots themselves.
+            async with self.old_session.stream("POST", url, content=content) as response:
+                await self._old_limiter.record(response.status_code)
+                # /runs/query only reads, so it is retried on the same statuses as a GET
+                if response.status_code not in RETRY_STATUS_CODES or attempt == RETRY_TOTAL:
+                    response.raise_for_status()
+                    yield response
+                    return
+            await asyncio.sleep(_retry_delay(response, attempt))
+
+    async def preload_existing_resources(self):
+        """
+        List every dataset and annotation queue in the new instance once, so that later
+        existence checks are answered locally instead of with one GET per name.
+        Datasets and queues created by this migrator afterwards are added to the snapshot,
+        which is used until clear_existing_resources is called.
+        """
+        existing_datasets, existing_queues = await asyncio.gather(
+            self._get_all_pages(self.new_session, f"{self.base_url}/datasets", params={}),
+            self._get_all_pages(self.new_session, f"{self.base_url}/annotation-queues", params={}),
+        )
+        self._existing_datasets_by_name = _group_by_name(existing_datasets)
+        self._existing_queues_by_name = _group_by_name(existing_queues)
+
+    def clear_existing_resources(self):
+        """
+        Drop the snapshot taken by preload_existing_resources, so that existence checks
+        ask the new instance again.
+        """
+        self._existing_datasets_by_name = None
+        self._existing_queues_by_name = None
+
+    async def _run_once(self, tasks: Dict[str, asyncio.Task], key: str, migrate: Callable[[], Awaitable[str]]) -> str:
+        """
+        Run `migrate` at most once per key. Concurrent and later callers await the same task.
+        A failed migration is forgotten so that it can be retried.
+        """
+        task = tasks.get(key)
+        if task is None:
+            task = tasks[key] = asyncio.ensure_future(migrate())
+
+            def forget_on_failure(task: asyncio.Task):
+                if task.cancelled() or task.exception() is not None:
+                    tasks.pop(key, None)
+
+            task.add_done_callback(forget_on_failure)
+        # Shield so one cancelled caller does not cancel the migration for the others
+        return await asyncio.shield(task)
+
+    async def migrate_dataset(
+            self,
+            original_dataset_id: str,
+            check_if_already_exists=True,
+            migration_mode: Literal["EXAMPLES", "EXAMPLES_AND_EXPERIMENTS", "DATASET_ONLY"] = "EXAMPLES"
+        ) -> str:
+        """
+        Migrate a dataset and all its examples from old to new instance.
+        Returns the new dataset ID.
+        """
+        migrate = partial(self._migrate_dataset, original_dataset_id, check_if_already_exists, migration_mode)
+        if not check_if_already_exists:
+            return await migrate()
+        return await self._run_once(self._dataset_tasks, original_dataset_id, migrate)
+
+    async def _migrate_dataset(self, original_dataset_id: str, check_if_already_exists: bool, migration_mode: str) -> str:
+        # Get original dataset
+        original_dataset = await self._request(
+            self.old_session, "GET", f"{self.base_url}/datasets/{original_dataset_id}"
+        )
+
+        # Check if dataset already exists in new instance
+        if check_if_already_exists:
+            if self._existing_datasets_by_name is not None:
+                maybe_existing_datasets = self._existing_datasets_by_name.get(original_dataset["name"], [])
+            else:
+                maybe_existing_datasets = await self._request(
+                    self.new_session, "GET", f"{self.base_url}/datasets", params={"name": original_dataset["name"]}
+                )
+            if "detail" not in maybe_existing_datasets:
+                if len(maybe_existing_datasets) > 1:
+                    raise ValueError(f"Found multiple datasets with name {original_dataset['name']} in new instance")
+                elif len(maybe_existing_datasets) == 1:
+                    return maybe_existing_datasets[0]["id"]
+
+        # Create new dataset
+        create_dataset_payload = _create_dataset_payload(original_dataset)
+        new_dataset = await self._request(
+            self.new_session, "POST", f"{self.base_url}/datasets", json=create_dataset_payload
+        )
+        new_dataset_id = new_dataset["id"]
+        if self._existing_datasets_by_name is not None:
+            self._existing_datasets_by_name.setdefault(original_dataset["name"], []).append(new_dataset)
+
+        # Migrate examples, if requested
+        if migration_mode == "EXAMPLES":
+            await self.migrate_dataset_examples(original_dataset_id, new_dataset_id)
+        elif migration_mode == "EXAMPLES_AND_EXPERIMENTS":
+            original_to_new_example_ids = await self.migrate_dataset_examples(original_dataset_id, new_dataset_id)
+            await self.migrate_dataset_experiments(original_dataset_id, new_dataset_id, original_to_new_example_ids)
+        elif migration_mode == "DATASET_ONLY":
+            pass
+
+        return new_dataset_id
+
+    async def migrate_dataset_examples(self, original_dataset_id: str, new_dataset_id: str) -> Dict[str, str]:
+        """
+        Migrate all examples from old dataset to new dataset.
+        Returns mapping of old example IDs to new example IDs.
+        """
+        original_to_new_example_ids = {}
+
+        async def create_examples(original_examples: List[Dict[str, Any]]):
+            new_examples_payload = [_new_example_payload(example, new_dataset_id) for example in original_examples]
+            new_examples = await self._request(
+                self.new_session,
+                "POST",
+                f"{self.base_url}/examples/bulk",
+                json=new_examples_payload,
+                compress=True,
+            )
+
+            # Extend ID mapping with this chunk
+            original_to_new_example_ids.update(zip(
+                (example["id"] for example in original_examples),
+                (example["id"] for example in new_examples),
+            ))
+
+        # Stream examples from old dataset into new dataset, keeping a few bulk uploads in flight
+        all_original_examples = self._iter_all_pages(
+            self.old_session,
+            f"{self.base_url}/examples",
+            params={"dataset": original_dataset_id},
+        )
+        example_chunks = _achunked(all_original_examples, EXAMPLES_BULK_CHUNK_SIZE)
+        pending_uploads = []
+        try:
+            async for original_examples in example_chunks:
+                if len(pending_uploads) >= MAX_PENDING_UPLOADS:
+                    await pending_uploads.pop(0)
+                pending_uploads.append(asyncio.ensure_future(create_examples(original_examples)))
+            await asyncio.gather(*pending_uploads)
+        except BaseException:
+            await _cancel_all(pending_uploads)
+            raise
+        finally:
+            await example_chunks.aclose()
+            await all_original_examples.aclose()
+
+        return original_to_new_example_ids
+
+    async def migrate_dataset_experiments(self, original_dataset_id: str, new_dataset_id: str, original_to_new_example_ids: Dict[str, str]):
+        """
+        Migrate all experiments from old dataset to new dataset.
+        """
+        # Get all experiments from old dataset
+        experiments = await self._get_all_pages(
+            self.old_session,
+            f"{self.base_url}/sessions",
+            params={"reference_dataset": original_dataset_id},
+        )
+
+        # Create experiments in new dataset
+        new_experiments = await asyncio.gather(*[
+            self._request(
+                self.new_session,
+                "POST",
+                f"{self.base_url}/sessions",
+                json=_create_tracer_payload(experiment, new_dataset_id),
+            )
+            for experiment in experiments
+        ])
+        original_to_new_experiment_ids = {
+            experiment["id"]: new_experiment["id"]
+            for experiment, new_experiment in zip(experiments, new_experiments)
+        }
+
+        # Pull runs from old experiments and push to new experiments, keeping a few pushes in flight
+        get_runs_payload = {
+            "session": [experiment["id"] for experiment in experiments],
+            "skip_pagination": False,
+        }
+        original_runs_iter = self._iter_runs(get_runs_payload)
+        run_batches = _achunked(original_runs_iter, RUNS_BATCH_SIZE)
+        pending_pushes = []
+        try:
+            async for original_runs in run_batches:
+                new_runs_payload = {
+                    "post": [
+                        _new_run_payload(run, original_to_new_experiment_ids, original_to_new_example_ids)
+                        for run in original_runs
+                    ]
+                }
+                if len(pending_pushes) >= MAX_PENDING_UPLOADS:
+                    await pending_pushes.pop(0)
+                pending_pushes.append(asyncio.ensure_future(self._request(
+                    self.new_session, "POST", f"{self.base_url}/runs/batch", json=new_runs_payload, compress=True
+                )))
+            await asyncio.gather(*pending_pushes)
+        except BaseException:
+            await _cancel_all(pending_pushes)
+            raise
+        finally:
+            await run_batches.aclose()
+            await original_runs_iter.aclose()
+
+    async def migrate_annotation_queue(self,
+                                       old_annotation_queue_id: str,
+                                       check_if_already_exists=True,
+                                       migration_mode: Literal["QUEUE_AND_DATASET", "QUEUE_ONLY"] = "QUEUE_AND_DATASET"
+                                       ) -> str:
+        """
+        Migrate an annotation queue from old to new instance.
+        """
+        migrate = partial(self._migrate_annotation_queue, old_annotation_queue_id, check_if_already_exists, migration_mode)
+        if not check_if_already_exists:
+            return await migrate()
+        return await self._run_once(self._queue_tasks, old_annotation_queue_id, migrate)
+
+    async def _migrate_annotation_queue(self, old_annotation_queue_id: str, check_if_already_exists: bool, migration_mode: str) -> str:
+        # Get original annotation queue
+        original_annotation_queue = await self._request(
+            self.old_session, "GET", f"{self.base_url}/annotation-queues/{old_annotation_queue_id}"
+        )
+
+        # Check if annotation queue already exists in new instance
+        if check_if_already_exists:
+            if self._existing_queues_by_name is not None:
+                maybe_existing_annotation_queues = self._existing_queues_by_name.get(original_annotation_queue["name"], [])
+            else:
+                maybe_existing_annotation_queues = await self._request(
+                    self.new_session, "GET", f"{self.base_url}/annotation-queues", params={"name": original_annotation_queue["name"]}
+                )
+            if "detail" not in maybe_existing_annotation_queues:
+                if len(maybe_existing_annotation_queues) > 1:
+                    raise ValueError(f"Found multiple annotation queues with name {original_annotation_queue['name']} in new instance")
+                elif len(maybe_existing_annotation_queues) == 1:
+                    return maybe_existing_annotation_queues[0]["id"]
+
+        # Migrate dataset, if requested
+        default_dataset = None
+        if migration_mode == "QUEUE_AND_DATASET" and original_annotation_queue["default_dataset"] is not None:
+            default_dataset = await self.migrate_dataset(
+                original_annotation_queue["default_dataset"],
+                check_if_already_exists=True,
+                migration_mode="EXAMPLES"
+            )
+        elif migration_mode == "QUEUE_ONLY":
+            pass
+
+        # Create new annotation queue
+        create_annotation_queue_payload = _create_annotation_queue_payload(original_annotation_queue, default_dataset)
+        new_annotation_queue = await self._request(
+            self.new_session, "POST", f"{self.base_url}/annotation-queues", json=create_annotation_queue_payload
+        )
+        if self._existing_queues_by_name is not None:
+            self._existing_queues_by_name.setdefault(original_annotation_queue["name"], []).append(new_annotation_queue)
+        return new_annotation_queue["id"]
+
+    async def migrate_project_rules(self, old_project_id: str, new_project_id: str):
+        """
+        Migrate all rules from a tracing project from old to new instance
+        """
+        # Get original rules
+        old_rules = await self._request(
+            self.old_session, "GET", f"{self.base_url}/runs/rules", params={"session_id": old_project_id}
+        )
+
+        # Look up existing datasets and queues once, rather than once per referenced name,
+        # when the rules reference enough of them for that to pay off
+        referenced_ids = {
+            referenced_id
+            for old_rule in old_rules
+            if old_rule["dataset_id"] is None
+            for referenced_id in (old_rule["add_to_dataset_id"], old_rule["add_to_annotation_queue_id"])
+            if referenced_id is not None
+        }
+        preload = self._existing_datasets_by_name is None and len(referenced_ids) >= PRELOAD_MIN_REFERENCES
+        if preload:
+            await self.preload_existing_resources()
+
+        # Handle dataset migration if needed. Rules are migrated concurrently; rules that share
+        # a dataset or annotation queue wait on the same migration.
+        async def migrate_rule(old_rule: Dict[str, Any]):
+            # This should never have a dataset_id
+            if old_rule["dataset_id"] is not None:
+                return
+
+            # Get old dataset name, if it doesn't exist in new instance yet, create it
+            add_to_dataset_id = None
+            if old_rule["add_to_dataset_id"] is not None:
+                add_to_dataset_id = await self.migrate_dataset(
+                    old_rule["add_to_dataset_id"],
+                    check_if_already_exists=True,
+                    migration_mode="EXAMPLES"
+                )
+
+            # Get old annotation queue name, if it doesn't exist in new instance yet, create it
+            add_to_annotation_queue_id = None
+            if old_rule["add_to_annotation_queue_id"] is not None:
+                add_to_annotation_queue_id = await self.migrate_annotation_queue(
+                    old_rule["add_to_annotation_queue_id"],
+                    check_if_already_exists=True,
+                    migration_mode="QUEUE_AND_DATASET"
+                )
+
+            # Create new rule
+            create_rule_payload = _create_rule_payload(old_rule, new_project_id, add_to_annotation_queue_id, add_to_dataset_id)
+            await self._request(
+                self.new_session, "POST", f"{self.base_url}/runs/rules", json=create_rule_payload
+            )
+
+        try:
+            await asyncio.gather(*[migrate_rule(old_rule) for old_rule in old_rules])
+        finally:
+            # The snapshot is only trusted while these rules are migrated
+            if preload:
+                self.clear_existing_resources()
+
+    async def migrate_prompt(self, original_prompt_id: str):
+        """
+        Migrate a prompt from original instance to new instance.
+        The LangSmith SDK client is synchronous, so the pull and push run in a worker thread.
+        """
+        def migrate():
+            prompt_object = self.old_client.pull_prompt_commit(
+                original_prompt_id, include_model=True
+            )
+            self.new_client.push_prompt(prompt_identifier=original_prompt_id, object=prompt_object.manifest)
+
+        await asyncio.to_thread(migrate)
+
+    async def migrate_prompts(self, original_prompt_ids: List[str]):
+        """
+        Migrate several prompts from original instance to new instance, concurrently.
+        """
+        prompt_semaphore = asyncio.Semaphore(PROMPT_MIGRATION_WORKERS)
+
+        async def migrate(original_prompt_id: str):
+            async with prompt_semaphore:
+                await self.migrate_prompt(original_prompt_id)
+
+        await asyncio.gather(*[migrate(original_prompt_id) for original_prompt_id in original_prompt_ids])
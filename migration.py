@@ -1,7 +1,368 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from langsmith import Client
-from typing import Dict, Literal
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional
+import gzip
 import json
+import orjson
+import queue
+import re
+import threading
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+PAGE_SIZE = 100  # Largest limit accepted by the LangSmith list endpoints
+PAGE_FETCH_WORKERS = 8
+EXAMPLES_BULK_CHUNK_SIZE = 500
+EXPERIMENT_CREATE_WORKERS = 16
+PROMPT_MIGRATION_WORKERS = 8
+RUNS_BATCH_SIZE = 200
+RUNS_PREFETCH_BATCHES = 4
+# Distinct datasets/queues a project's rules must reference before listing the whole new
+# workspace is cheaper than looking each of them up by name
+PRELOAD_MIN_REFERENCES = 10
+# Sent on every request. ACCEPT_ENCODING includes br/zstd when brotli/zstandard are installed.
+SESSION_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Content-Type": "application/json",
+}
+GZIP_HEADERS = {"Content-Encoding": "gzip"}
+GZIP_COMPRESS_LEVEL = 3
+MAX_CONNECTIONS = 32
+MIN_CONCURRENT_REQUESTS = 2
+# Consecutive successful responses after which a throttled limit grows back by one
+RECOVERY_SUCCESSES = 50
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = [429, 502, 503, 504]
+# Writes may already have been applied when a gateway error comes back, so requests with
+# these methods are only retried when rate-limited (429), which the server rejects unapplied.
+NON_IDEMPOTENT_METHODS = frozenset(["POST", "PATCH"])
+# orjson decodes integers outside the 64-bit range as floats, so bodies with a run of this
+# many digits outside a fraction are decoded with the stdlib json module, which keeps them exact
+LONG_DIGIT_RUN = re.compile(rb"(?<![.\d])\d{19,}")
+
+
+def _chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Yield lists of up to `size` consecutive items from `iterable`.
+    """
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _decimal_to_float(value: Any) -> float:
+    """
+    Encode the Decimals that ijson parses JSON fractions into as floats.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(payload: Any) -> bytes:
+    """
+    Serialize `payload` with orjson, falling back to the stdlib json module for the
+    integers outside the 64-bit range that orjson rejects.
+    """
+    try:
+        return orjson.dumps(payload, default=_decimal_to_float)
+    except TypeError:
+        return json.dumps(payload, default=_decimal_to_float).encode()
+
+
+def _json_loads(content: bytes) -> Any:
+    """
+    Decode a JSON body with orjson, unless it may hold integers that orjson would turn into floats.
+    """
+    if LONG_DIGIT_RUN.search(content):
+        return json.loads(content)
+    return orjson.loads(content)
+
+
+def _group_by_name(resources: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group listed resources by their name.
+    """
+    resources_by_name = {}
+    for resource in resources:
+        resources_by_name.setdefault(resource["name"], []).append(resource)
+    return resources_by_name
+
+
+def _create_dataset_payload(original_dataset: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Body for creating a copy of `original_dataset` in the new instance.
+    """
+    return {
+        "name": original_dataset["name"],
+        "description": original_dataset["description"],
+        "created_at": original_dataset["created_at"],
+        "inputs_schema_definition": original_dataset["inputs_schema_definition"],
+        "outputs_schema_definition": original_dataset["outputs_schema_definition"],
+        "externally_managed": original_dataset["externally_managed"],
+        "transformations": original_dataset["transformations"] if original_dataset["transformations"] else [],
+        "data_type": original_dataset["data_type"],
+    }
+
+
+def _new_example_payload(example: Dict[str, Any], new_dataset_id: str) -> Dict[str, Any]:
+    """
+    Body for copying `example` into the new dataset through /examples/bulk.
+    """
+    return {
+        "dataset_id": new_dataset_id,
+        "inputs": example["inputs"],
+        "outputs": example["outputs"],
+        "metadata": example["metadata"],
+        "created_at": example["created_at"],
+        "split": example["metadata"].get("dataset_split", "base") if example["metadata"] else "base",
+    }
+
+
+def _create_tracer_payload(experiment: Dict[str, Any], new_dataset_id: str) -> Dict[str, Any]:
+    """
+    Body for creating a copy of `experiment` against the new dataset.
+    """
+    return {
+        "name": experiment["name"],
+        "description": experiment["description"],
+        "reference_dataset_id": new_dataset_id,
+        "default_dataset_id": experiment["default_dataset_id"],
+        "start_time": experiment["start_time"],
+        "end_time": experiment["end_time"],
+        "extra": experiment["extra"],
+        "trace_tier": experiment.get("trace_tier"),
+    }
+
+
+def _new_run_payload(
+        run: Dict[str, Any],
+        original_to_new_experiment_ids: Dict[str, str],
+        original_to_new_example_ids: Dict[str, str]
+    ) -> Dict[str, Any]:
+    """
+    Body for copying `run` into its migrated experiment through /runs/batch.
+    """
+    return {
+        "name": run["name"],
+        "inputs": run["inputs"],
+        "run_type": run["run_type"],
+        "start_time": run["start_time"],
+        "end_time": run["end_time"],
+        "extra": run["extra"],
+        "error": run.get("error"),
+        "serialized": run.get("serialized", {}),
+        "outputs": run["outputs"],
+        "parent_run_id": run.get("parent_run_id"),
+        "events": run.get("events", []),
+        "tags": run.get("tags", []),
+        "trace_id": run["trace_id"],
+        "id": run["id"],
+        "dotted_order": run["dotted_order"],
+        "session_id": original_to_new_experiment_ids[run["session_id"]],  # Map to new session ID
+        "session_name": run.get("session_name"),
+        "reference_example_id": original_to_new_example_ids.get(run.get("reference_example_id")),  # Map to new example ID if exists
+        "input_attachments": run.get("input_attachments", {}),
+        "output_attachments": run.get("output_attachments", {})
+    }
+
+
+def _create_annotation_queue_payload(original_annotation_queue: Dict[str, Any], default_dataset: Optional[str]) -> Dict[str, Any]:
+    """
+    Body for creating a copy of `original_annotation_queue` in the new instance.
+    """
+    return {
+        "name": original_annotation_queue["name"],
+        "description": original_annotation_queue["description"],
+        "created_at": original_annotation_queue["created_at"],
+        "updated_at": original_annotation_queue["updated_at"],
+        "default_dataset": default_dataset,
+        "num_reviewers_per_item": original_annotation_queue["num_reviewers_per_item"],
+        "enable_reservations": original_annotation_queue["enable_reservations"],
+        "reservation_minutes": original_annotation_queue["reservation_minutes"],
+        "rubric_items": original_annotation_queue["rubric_items"],
+        "rubric_instructions": original_annotation_queue["rubric_instructions"],
+        "session_ids": []
+    }
+
+
+def _create_rule_payload(
+        old_rule: Dict[str, Any],
+        new_project_id: str,
+        add_to_annotation_queue_id: Optional[str],
+        add_to_dataset_id: Optional[str]
+    ) -> Dict[str, Any]:
+    """
+    Body for creating a copy of `old_rule` on the new project.
+    """
+    return {
+        "display_name": old_rule["display_name"],
+        "session_id": new_project_id,
+        "is_enabled": old_rule["is_enabled"],
+        "dataset_id": None,
+        "sampling_rate": old_rule["sampling_rate"],
+        "filter": old_rule["filter"],
+        "trace_filter": old_rule["trace_filter"],
+        "tree_filter": old_rule["tree_filter"],
+        "add_to_annotation_queue_id": add_to_annotation_queue_id,
+        "add_to_dataset_id": add_to_dataset_id,
+        "add_to_dataset_prefer_correction": old_rule["add_to_dataset_prefer_correction"],
+        "use_corrections_dataset": old_rule["use_corrections_dataset"],
+        "num_few_shot_examples": old_rule["num_few_shot_examples"],
+        "extend_only": old_rule["extend_only"],
+        "transient": old_rule["transient"],
+        "backfill_from": old_rule["backfill_from"],
+        "evaluators": old_rule["evaluators"],
+        "code_evaluators": old_rule["code_evaluators"],
+        "alerts": old_rule["alerts"],
+        "webhooks": old_rule["webhooks"]
+    }
+
+
+class _RunsPageParser:
+    """
+    Rebuild runs one at a time from the ijson parse events of a /runs/query response,
+    remembering the next-page cursor.
+    """
+
+    def __init__(self):
+        self.next_cursor: Optional[str] = None
+        self.saw_cursors = False
+        self._builder = None
+
+    def feed(self, prefix: str, event: str, value: Any) -> Optional[Dict[str, Any]]:
+        """
+        Consume one parse event and return a run once it is complete.
+        """
+        if self._builder is not None:
+            self._builder.event(event, value)
+            if prefix == "runs.item" and event == "end_map":
+                run, self._builder = self._builder.value, None
+                return run
+        elif prefix == "runs.item" and event == "start_map":
+            self._builder = ijson.ObjectBuilder()
+            self._builder.event(event, value)
+        elif prefix == "" and event == "map_key" and value == "cursors":
+            self.saw_cursors = True
+        elif prefix == "cursors.next" and event == "string":
+            self.next_cursor = value
+        return None
+
+    def check_complete(self):
+        """
+        Raise if the response ended without the cursors of a /runs/query page.
+        """
+        if not self.saw_cursors:
+            raise ValueError("Response from /runs/query is missing 'cursors'")
+
+
+class _AdaptiveLimit:
+    """
+    Concurrency limit for one LangSmith instance. It drops by one on every rate-limited (429)
+    response, down to `min_limit`, and grows back by one after `recovery_successes`
+    consecutive successful responses, up to `max_limit`.
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = MIN_CONCURRENT_REQUESTS, recovery_successes: int = RECOVERY_SUCCESSES):
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.recovery_successes = recovery_successes
+        self.limit = max_limit
+        self._in_flight = 0
+        self._successes = 0
+
+    def _adjust(self, status_code: int):
+        if status_code == 429:
+            self.limit = max(self.min_limit, self.limit - 1)
+            self._successes = 0
+        elif status_code < 400:
+            self._successes += 1
+            if self._successes >= self.recovery_successes:
+                self.limit = min(self.max_limit, self.limit + 1)
+                self._successes = 0
+
+
+class AdaptiveConcurrencyLimiter(_AdaptiveLimit):
+    """
+    Thread-safe adaptive limit on the number of in-flight requests.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record(self, status_code: int):
+        with self._condition:
+            self._adjust(status_code)
+            self._condition.notify_all()
+
+
+class _AdaptiveRetry(Retry):
+    """
+    Retry that reports every rate-limited attempt to a limiter before backing off.
+    Non-idempotent requests are only retried when rate-limited.
+    """
+
+    def __init__(self, *args, limiter: Optional[AdaptiveConcurrencyLimiter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limiter = limiter
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.limiter = self.limiter
+        return retry
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        # Retry's default allowed_methods excludes these, so read errors on them are never retried either
+        if method.upper() in NON_IDEMPOTENT_METHODS:
+            return status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if self.limiter is not None and response is not None and response.status == 429:
+            self.limiter.record(429)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _AdaptiveHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that holds a limiter slot for each request, including its retries and backoff.
+    """
+
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        self.limiter.acquire()
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            self.limiter.release()
+        self.limiter.record(response.status_code)
+        return response
 
 class LangsmithMigrator:
     
@@ -11,6 +372,173 @@ class LangsmithMigrator:
         self.base_url = "https://api.smith.langchain.com/api/v1"
         self.old_client = Client(api_key=old_api_key)
         self.new_client = Client(api_key=new_api_key)
+        self.old_session = self._create_session(self.old_headers)
+        self.new_session = self._create_session(self.new_headers)
+        self._dataset_futures: Dict[str, Future] = {}
+        self._queue_futures: Dict[str, Future] = {}
+        self._migration_lock = threading.Lock()
+        # Snapshots of the new instance's datasets/queues by name, filled by preload_existing_resources
+        self._existing_datasets_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._existing_queues_by_name: Optional[Dict[str, List[Dict[str, Any]]]] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Release the pooled connections held by both sessions.
+        """
+        self.old_session.close()
+        self.new_session.close()
+
+    @staticmethod
+    def _create_session(headers: Dict[str, str]) -> requests.Session:
+        """
+        Create a session that reuses connections across calls and retries transient failures.
+        Concurrent requests through the session share an adaptive limit that backs off on 429s.
+        """
+        session = requests.Session()
+        session.headers.update({**SESSION_HEADERS, **headers})
+        # Start at the most requests the migrator's executors send through one session at once,
+        # so that the first 429s already throttle them
+        limiter = AdaptiveConcurrencyLimiter(max_limit=max(PAGE_FETCH_WORKERS + 1, EXPERIMENT_CREATE_WORKERS))
+        retry = _AdaptiveRetry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True,
+            limiter=limiter,
+        )
+        adapter = _AdaptiveHTTPAdapter(
+            limiter,
+            pool_connections=MAX_CONNECTIONS,
+            pool_maxsize=MAX_CONNECTIONS,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def _get_json(session: requests.Session, url: str, **kwargs) -> Any:
+        """
+        GET a URL and decode the response body.
+        """
+        response = session.get(url, **kwargs)
+        return _json_loads(response.content)
+
+    @staticmethod
+    def _post_json(session: requests.Session, url: str, payload: Any, compress: bool = False) -> Any:
+        """
+        POST a JSON payload and decode the response body, if any.
+        Large payloads can be gzip-compressed with `compress=True`.
+        """
+        if compress:
+            response = session.post(
+                url,
+                data=gzip.compress(_json_dumps(payload), compresslevel=GZIP_COMPRESS_LEVEL),
+                headers=GZIP_HEADERS,
+            )
+        else:
+            response = session.post(url, data=_json_dumps(payload))
+        return _json_loads(response.content) if response.content else None
+
+    def _iter_all_pages(self, session: requests.Session, url: str, params: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every item from an offset-paginated endpoint, page by page.
+        Requests a growing window of pages concurrently and stops at the first short page.
+        """
+        def get_page(offset: int) -> List[Dict[str, Any]]:
+            return self._get_json(session, url, params={**params, "offset": offset, "limit": PAGE_SIZE})
+
+        offset = 0
+        window = 1
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+            while True:
+                offsets = [offset + i * PAGE_SIZE for i in range(window)]
+                for page in executor.map(get_page, offsets):
+                    yield from page
+                    if len(page) < PAGE_SIZE:
+                        return
+                offset += window * PAGE_SIZE
+                window = min(window * 2, PAGE_FETCH_WORKERS)
+
+    def _get_all_pages(self, session: requests.Session, url: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Fetch every item from an offset-paginated endpoint.
+        """
+        return list(self._iter_all_pages(session, url, params))
+
+    def _iter_runs(self, get_runs_payload: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield every run matched by a /runs/query payload, following the cursor across pages.
+        With ijson installed, runs are parsed one at a time from each streamed response
+        instead of loading whole pages into memory.
+        """
+        url = f"{self.base_url}/runs/query"
+        while True:
+            if ijson is None:
+                get_runs_body = self._post_json(self.old_session, url, get_runs_payload)
+                yield from get_runs_body["runs"]
+                next_cursor = get_runs_body["cursors"]["next"]
+            else:
+                parser = _RunsPageParser()
+                with self.old_session.post(url, data=_json_dumps(get_runs_payload), stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    for prefix, event, value in ijson.parse(response.raw):
+                        run = parser.feed(prefix, event, value)
+                        if run is not None:
+                            yield run
+                parser.check_complete()
+                next_cursor = parser.next_cursor
+            if next_cursor is None:
+                return
+            get_runs_payload = {**get_runs_payload, "cursor": next_cursor}
+
+    def preload_existing_resources(self):
+        """
+        List every dataset and annotation queue in the new instance once, so that later
+        existence checks are answered locally instead of with one GET per name.
+        Datasets and queues created by this migrator afterwards are added to the snapshot,
+        which is used until clear_existing_resources is called.
+        """
+        self._existing_datasets_by_name = _group_by_name(
+            self._iter_all_pages(self.new_session, f"{self.base_url}/datasets", params={})
+        )
+        self._existing_queues_by_name = _group_by_name(
+            self._iter_all_pages(self.new_session, f"{self.base_url}/annotation-queues", params={})
+        )
+
+    def clear_existing_resources(self):
+        """
+        Drop the snapshot taken by preload_existing_resources, so that existence checks
+        ask the new instance again.
+        """
+        self._existing_datasets_by_name = None
+        self._existing_queues_by_name = None
+
+    def _run_once(self, futures: Dict[str, Future], key: str, migrate: Callable[[], str]) -> str:
+        """
+        Run `migrate` at most once per key. Concurrent and later callers share its result.
+        A failed migration is forgotten so that it can be retried.
+        """
+        with self._migration_lock:
+            future = futures.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = futures[key] = Future()
+        if is_owner:
+            try:
+                future.set_result(migrate())
+            except BaseException as e:
+                with self._migration_lock:
+                    del futures[key]
+                future.set_exception(e)
+        return future.result()
         
     def migrate_dataset(
             self, 
@@ -22,43 +550,44 @@ class LangsmithMigrator:
         Migrate a dataset and all its examples from old to new instance.
         Returns the new dataset ID.
         """
+        migrate = partial(self._migrate_dataset, original_dataset_id, check_if_already_exists, migration_mode)
+        if not check_if_already_exists:
+            return migrate()
+        return self._run_once(self._dataset_futures, original_dataset_id, migrate)
+
+    def _migrate_dataset(self, original_dataset_id: str, check_if_already_exists: bool, migration_mode: str) -> str:
         # Get original dataset
-        response = requests.get(
-            f"{self.base_url}/datasets/{original_dataset_id}",
-            headers=self.old_headers
+        original_dataset = self._get_json(
+            self.old_session,
+            f"{self.base_url}/datasets/{original_dataset_id}"
         )
-        original_dataset = response.json()
         
         # Check if dataset already exists in new instance
         if check_if_already_exists:
-            response = requests.get(
-                f"{self.base_url}/datasets?name={original_dataset['name']}",
-                headers=self.new_headers
-            )
-            if "detail" not in response.json():
-                maybe_existing_datasets = response.json()
+            if self._existing_datasets_by_name is not None:
+                maybe_existing_datasets = self._existing_datasets_by_name.get(original_dataset["name"], [])
+            else:
+                maybe_existing_datasets = self._get_json(
+                    self.new_session,
+                    f"{self.base_url}/datasets",
+                    params={"name": original_dataset["name"]}
+                )
+            if "detail" not in maybe_existing_datasets:
                 if len(maybe_existing_datasets) > 1:
                     raise ValueError(f"Found multiple datasets with name {original_dataset['name']} in new instance")
                 elif len(maybe_existing_datasets) == 1:
                     return maybe_existing_datasets[0]["id"]
         
         # Create new dataset
-        create_dataset_payload = {
-            "name": original_dataset["name"],
-            "description": original_dataset["description"],
-            "created_at": original_dataset["created_at"],
-            "inputs_schema_definition": original_dataset["inputs_schema_definition"],
-            "outputs_schema_definition": original_dataset["outputs_schema_definition"],
-            "externally_managed": original_dataset["externally_managed"],
-            "transformations": original_dataset["transformations"] if original_dataset["transformations"] else [],
-            "data_type": original_dataset["data_type"],
-        }
-        create_response = requests.post(
+        create_dataset_payload = _create_dataset_payload(original_dataset)
+        new_dataset = self._post_json(
+            self.new_session,
             f"{self.base_url}/datasets",
-            headers=self.new_headers,
-            json=create_dataset_payload
+            create_dataset_payload
         )
-        new_dataset_id = create_response.json()['id']
+        new_dataset_id = new_dataset['id']
+        if self._existing_datasets_by_name is not None:
+            self._existing_datasets_by_name.setdefault(original_dataset["name"], []).append(new_dataset)
         
         # Migrate examples, if requested
         if migration_mode == "EXAMPLES":
@@ -76,134 +605,99 @@ class LangsmithMigrator:
         Migrate all examples from old dataset to new dataset.
         Returns mapping of old example IDs to new example IDs.
         """
-        # Get all examples from old dataset
-        offset = 0
-        last_request_size = 100
-        original_examples = []
-        while last_request_size == 100:
-            response = requests.get(
-                f"{self.base_url}/examples",
-                params={"dataset": original_dataset_id, "offset": offset},
-                headers=self.old_headers,
-            )
-            examples = response.json()
-            last_request_size = len(examples)
-            original_examples += examples
-            offset = len(original_examples)
-            
-        # Create examples in new dataset
-        new_examples_payload = [
-            {
-                "dataset_id": new_dataset_id,
-                "inputs": example["inputs"],
-                "outputs": example["outputs"],
-                "metadata": example["metadata"],
-                "created_at": example["created_at"],
-                "split": example["metadata"].get("dataset_split", "base") if example["metadata"] else "base",
-            }
-            for example in original_examples
-        ]
-        response = requests.post(
-            f"{self.base_url}/examples/bulk",
-            headers=self.new_headers,
-            json=new_examples_payload
+        # Stream examples from old dataset into new dataset, one bulk chunk at a time
+        original_to_new_example_ids = {}
+        all_original_examples = self._iter_all_pages(
+            self.old_session,
+            f"{self.base_url}/examples",
+            params={"dataset": original_dataset_id},
         )
-        new_examples = response.json()
-        
-        # Create ID mapping
-        return {
-            original_examples[i]["id"]: new_examples[i]["id"]
-            for i in range(len(new_examples))
-        }
+        for original_examples in _chunked(all_original_examples, EXAMPLES_BULK_CHUNK_SIZE):
+            new_examples_payload = [_new_example_payload(example, new_dataset_id) for example in original_examples]
+            new_examples = self._post_json(
+                self.new_session,
+                f"{self.base_url}/examples/bulk",
+                new_examples_payload,
+                compress=True
+            )
+
+            # Extend ID mapping with this chunk
+            original_to_new_example_ids.update(zip(
+                (example["id"] for example in original_examples),
+                (example["id"] for example in new_examples),
+            ))
+
+        return original_to_new_example_ids
     
     def migrate_dataset_experiments(self, original_dataset_id: str, new_dataset_id: str, original_to_new_example_ids: Dict[str, str]):
         """
         Migrate all experiments from old dataset to new dataset.
         """
         # Get all experiments from old dataset
-        offset = 0
-        last_request_size = 100
-        experiments = []
-        while last_request_size == 100:
-            response = requests.get(
-                f"{self.base_url}/sessions?reference_dataset={original_dataset_id}&offset={offset}",   
-                headers=self.old_headers,
-            )
-            experiment_batch = response.json()
-            last_request_size = len(experiment_batch)
-            experiments += experiment_batch
-            offset = len(experiments)  
+        experiments = self._get_all_pages(
+            self.old_session,
+            f"{self.base_url}/sessions",
+            params={"reference_dataset": original_dataset_id},
+        )
 
         # Create experiments in new dataset
-        original_to_new_experiment_ids = {}
-        for experiment in experiments:
-            create_tracer_payload = {
-                "name": experiment["name"],
-                "description": experiment["description"],
-                "reference_dataset_id": new_dataset_id,
-                "default_dataset_id": experiment["default_dataset_id"],
-                "start_time": experiment["start_time"],
-                "end_time": experiment["end_time"],
-                "extra": experiment["extra"],
-                "trace_tier": experiment.get("trace_tier"),
-            }
-            response = requests.post(
+        def create_experiment(experiment: Dict[str, Any]) -> str:
+            create_tracer_payload = _create_tracer_payload(experiment, new_dataset_id)
+            new_experiment = self._post_json(
+                self.new_session,
                 f"{self.base_url}/sessions",
-                headers=self.new_headers,
-                json=create_tracer_payload
+                create_tracer_payload
             )
-            new_experiment_id = response.json()["id"]
-            original_to_new_experiment_ids[experiment["id"]] = new_experiment_id   
+            return new_experiment["id"]
 
-        # Pull runs from old experiments and push to new experiments
-        get_runs_payload = {
-            "session": [experiment["id"] for experiment in experiments],
-            "skip_pagination": False,
+        with ThreadPoolExecutor(max_workers=EXPERIMENT_CREATE_WORKERS) as executor:
+            new_experiment_ids = list(executor.map(create_experiment, experiments))
+        original_to_new_experiment_ids = {
+            experiment["id"]: new_experiment_id
+            for experiment, new_experiment_id in zip(experiments, new_experiment_ids)
         }
-        while True:
-            get_runs_response = requests.post(
-                f"{self.base_url}/runs/query",
-                headers=self.old_headers,
-                json=get_runs_payload
-            )
-            original_runs = get_runs_response.json()["runs"]
-            new_runs_payload = {
-                "post": [
-                    {
-                        "name": run["name"],
-                        "inputs": run["inputs"],
-                        "run_type": run["run_type"],
-                        "start_time": run["start_time"],
-                        "end_time": run["end_time"],
-                        "extra": run["extra"],
-                        "error": run.get("error"),
-                        "serialized": run.get("serialized", {}),
-                        "outputs": run["outputs"],
-                        "parent_run_id": run.get("parent_run_id"),
-                        "events": run.get("events", []),
-                        "tags": run.get("tags", []),
-                        "trace_id": run["trace_id"],
-                        "id": run["id"],
-                        "dotted_order": run["dotted_order"],
-                        "session_id": original_to_new_experiment_ids[run["session_id"]],  # Map to new session ID
-                        "session_name": run.get("session_name"),
-                        "reference_example_id": original_to_new_example_ids.get(run.get("reference_example_id")),  # Map to new example ID if exists
-                        "input_attachments": run.get("input_attachments", {}),
-                        "output_attachments": run.get("output_attachments", {})
-                    }
-                    for run in original_runs
-                ]
+
+        # Pull runs from old experiments on a background thread while pushing to new experiments
+        run_batches = queue.Queue(maxsize=RUNS_PREFETCH_BATCHES)
+        stop_fetching = threading.Event()
+
+        def fetch_runs():
+            get_runs_payload = {
+                "session": [experiment["id"] for experiment in experiments],
+                "skip_pagination": False,
             }
-            # Send the request to create runs
-            requests.post(
-                f"{self.base_url}/runs/batch",
-                headers=self.new_headers,
-                json=new_runs_payload
-            )
-            if get_runs_response.json()["cursors"]["next"] is None:
-                break
-            else:
-                get_runs_payload["cursor"] = get_runs_response.json()["cursors"]["next"]
+            try:
+                for original_runs in _chunked(self._iter_runs(get_runs_payload), RUNS_BATCH_SIZE):
+                    run_batches.put(original_runs)
+                    if stop_fetching.is_set():
+                        break
+            finally:
+                run_batches.put(None)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetcher = executor.submit(fetch_runs)
+            try:
+                while (original_runs := run_batches.get()) is not None:
+                    new_runs_payload = {
+                        "post": [
+                            _new_run_payload(run, original_to_new_experiment_ids, original_to_new_example_ids)
+                            for run in original_runs
+                        ]
+                    }
+                    # Send the request to create runs
+                    self._post_json(
+                        self.new_session,
+                        f"{self.base_url}/runs/batch",
+                        new_runs_payload,
+                        compress=True
+                    )
+            except BaseException:
+                # Let the fetcher finish its current batch, then drain so it can exit
+                stop_fetching.set()
+                while run_batches.get() is not None:
+                    pass
+                raise
+            fetcher.result()
 
     def migrate_annotation_queue(self,
                                  old_annotation_queue_id: str,
@@ -213,21 +707,29 @@ class LangsmithMigrator:
         """
         Migrate an annotation queue from old to new instance.
         """
+        migrate = partial(self._migrate_annotation_queue, old_annotation_queue_id, check_if_already_exists, migration_mode)
+        if not check_if_already_exists:
+            return migrate()
+        return self._run_once(self._queue_futures, old_annotation_queue_id, migrate)
+
+    def _migrate_annotation_queue(self, old_annotation_queue_id: str, check_if_already_exists: bool, migration_mode: str) -> str:
         # Get original annotation queue
-        response = requests.get(
-            f"{self.base_url}/annotation-queues/{old_annotation_queue_id}",
-            headers=self.old_headers
+        original_annotation_queue = self._get_json(
+            self.old_session,
+            f"{self.base_url}/annotation-queues/{old_annotation_queue_id}"
         )
-        original_annotation_queue = response.json()
         
         # Check if annotation queue already exists in new instance
         if check_if_already_exists:
-            response = requests.get(
-                f"{self.base_url}/annotation_queues?name={original_annotation_queue['name']}",
-                headers=self.new_headers
-            )
-            if "detail" not in response.json():
-                maybe_existing_annotation_queues = response.json()
+            if self._existing_queues_by_name is not None:
+                maybe_existing_annotation_queues = self._existing_queues_by_name.get(original_annotation_queue["name"], [])
+            else:
+                maybe_existing_annotation_queues = self._get_json(
+                    self.new_session,
+                    f"{self.base_url}/annotation-queues",
+                    params={"name": original_annotation_queue["name"]}
+                )
+            if "detail" not in maybe_existing_annotation_queues:
                 if len(maybe_existing_annotation_queues) > 1:
                     raise ValueError(f"Found multiple annotation queues with name {original_annotation_queue['name']} in new instance")
                 elif len(maybe_existing_annotation_queues) == 1:
@@ -245,25 +747,15 @@ class LangsmithMigrator:
             pass
         
         # Create new annotation queue
-        create_annotation_queue_payload = {
-            "name": original_annotation_queue["name"],
-            "description": original_annotation_queue["description"],
-            "created_at": original_annotation_queue["created_at"],
-            "updated_at": original_annotation_queue["updated_at"],
-            "default_dataset": default_dataset,
-            "num_reviewers_per_item": original_annotation_queue["num_reviewers_per_item"],
-            "enable_reservations": original_annotation_queue["enable_reservations"],
-            "reservation_minutes": original_annotation_queue["reservation_minutes"],
-            "rubric_items": original_annotation_queue["rubric_items"],
-            "rubric_instructions": original_annotation_queue["rubric_instructions"],
-            "session_ids": []
-        }
-        response = requests.post(
+        create_annotation_queue_payload = _create_annotation_queue_payload(original_annotation_queue, default_dataset)
+        new_annotation_queue = self._post_json(
+            self.new_session,
             f"{self.base_url}/annotation-queues",
-            headers=self.new_headers,
-            json=create_annotation_queue_payload
+            create_annotation_queue_payload
         )
-        new_annotation_queue_id = response.json()["id"]
+        new_annotation_queue_id = new_annotation_queue["id"]
+        if self._existing_queues_by_name is not None:
+            self._existing_queues_by_name.setdefault(original_annotation_queue["name"], []).append(new_annotation_queue)
         return new_annotation_queue_id
 
 
@@ -272,64 +764,61 @@ class LangsmithMigrator:
         Migrate all rules from a tracing project from old to new instance
         """
         # Get original rules
-        response = requests.get(
-            f"{self.base_url}/runs/rules?session_id={old_project_id}",
-            headers=self.old_headers
+        old_rules = self._get_json(
+            self.old_session,
+            f"{self.base_url}/runs/rules",
+            params={"session_id": old_project_id}
         )
-        old_rules = response.json()
+
+        # Look up existing datasets and queues once, rather than once per referenced name,
+        # when the rules reference enough of them for that to pay off
+        referenced_ids = {
+            referenced_id
+            for old_rule in old_rules
+            if old_rule["dataset_id"] is None
+            for referenced_id in (old_rule["add_to_dataset_id"], old_rule["add_to_annotation_queue_id"])
+            if referenced_id is not None
+        }
+        preload = self._existing_datasets_by_name is None and len(referenced_ids) >= PRELOAD_MIN_REFERENCES
+        if preload:
+            self.preload_existing_resources()
         
-        # Handle dataset migration if needed
-        for old_rule in old_rules:
-            # This should never have a dataset_id
-            if old_rule["dataset_id"] is not None:
-                continue
-
-            # Get old dataset name, if it doesn't exist in new instance yet, create it
-            add_to_dataset_id = None
-            if old_rule["add_to_dataset_id"] is not None:
-                add_to_dataset_id = self.migrate_dataset(
-                    old_rule["add_to_dataset_id"], 
-                    check_if_already_exists=True,
-                    migration_mode="EXAMPLES"
-                )
+        try:
+            # Handle dataset migration if needed
+            for old_rule in old_rules:
+                # This should never have a dataset_id
+                if old_rule["dataset_id"] is not None:
+                    continue
+
+                # Get old dataset name, if it doesn't exist in new instance yet, create it
+                add_to_dataset_id = None
+                if old_rule["add_to_dataset_id"] is not None:
+                    add_to_dataset_id = self.migrate_dataset(
+                        old_rule["add_to_dataset_id"], 
+                        check_if_already_exists=True,
+                        migration_mode="EXAMPLES"
+                    )
             
-            # Get old annotation queue name, if it doesn't exist in new instance yet, create it
-            add_to_annotation_queue_id = None
-            if old_rule["add_to_annotation_queue_id"] is not None:
-                add_to_annotation_queue_id = self.migrate_annotation_queue(
-                    old_rule["add_to_annotation_queue_id"], 
-                    check_if_already_exists=True,
-                    migration_mode="QUEUE_AND_DATASET"
-                )
+                # Get old annotation queue name, if it doesn't exist in new instance yet, create it
+                add_to_annotation_queue_id = None
+                if old_rule["add_to_annotation_queue_id"] is not None:
+                    add_to_annotation_queue_id = self.migrate_annotation_queue(
+                        old_rule["add_to_annotation_queue_id"], 
+                        check_if_already_exists=True,
+                        migration_mode="QUEUE_AND_DATASET"
+                    )
         
-            # Create new rule
-            create_rule_payload = {
-                "display_name": old_rule["display_name"],
-                "session_id": new_project_id,
-                "is_enabled": old_rule["is_enabled"],
-                "dataset_id": None,
-                "sampling_rate": old_rule["sampling_rate"],
-                "filter": old_rule["filter"],
-                "trace_filter": old_rule["trace_filter"],
-                "tree_filter": old_rule["tree_filter"],
-                "add_to_annotation_queue_id": add_to_annotation_queue_id,
-                "add_to_dataset_id": add_to_dataset_id,
-                "add_to_dataset_prefer_correction": old_rule["add_to_dataset_prefer_correction"],
-                "use_corrections_dataset": old_rule["use_corrections_dataset"],
-                "num_few_shot_examples": old_rule["num_few_shot_examples"],
-                "extend_only": old_rule["extend_only"],
-                "transient": old_rule["transient"],
-                "backfill_from": old_rule["backfill_from"],
-                "evaluators": old_rule["evaluators"],
-                "code_evaluators": old_rule["code_evaluators"],
-                "alerts": old_rule["alerts"],
-                "webhooks": old_rule["webhooks"]
-            }
-            response = requests.post(
-                f"{self.base_url}/runs/rules",
-                headers=self.new_headers,
-                json=create_rule_payload
-            )
+                # Create new rule
+                create_rule_payload = _create_rule_payload(old_rule, new_project_id, add_to_annotation_queue_id, add_to_dataset_id)
+                self._post_json(
+                    self.new_session,
+                    f"{self.base_url}/runs/rules",
+                    create_rule_payload
+                )
+        finally:
+            # The snapshot is only trusted while these rules are migrated
+            if preload:
+                self.clear_existing_resources()
 
     def migrate_prompt(self, original_prompt_id: str) -> str:
         """
@@ -340,3 +829,10 @@ class LangsmithMigrator:
         )
         self.new_client.push_prompt(prompt_identifier=original_prompt_id, object=prompt_object.manifest)
 
+    def migrate_prompts(self, original_prompt_ids: List[str]):
+        """
+        Migrate several prompts from original instance to new instance, concurrently.
+        """
+        with ThreadPoolExecutor(max_workers=PROMPT_MIGRATION_WORKERS) as executor:
+            list(executor.map(self.migrate_prompt, original_prompt_ids))
+